@@ -29,7 +29,11 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ._utils import get_installed_plugins
+from ._utils import (
+    CORE_PLUGINS,
+    get_installed_plugins,
+    suggest_plugins_for_path,
+)
 
 if TYPE_CHECKING:
     from napari.types import PathLike
@@ -59,24 +63,30 @@ class ReaderPluginManager:
     ...     print(manager.get_installation_message())
     """
 
+    __slots__ = ('_suggested', 'path')
+
     def __init__(self, path: PathLike | None = None):
         self.path = Path(path) if path is not None else None
+        # Suggestions depend only on the path, so compute them once
+        self._suggested = (
+            tuple(suggest_plugins_for_path(self.path)) if self.path else ()
+        )
 
     @property
-    def installed_plugins(self) -> set[str]:
+    def installed_plugins(self) -> frozenset[str]:
         """Get names of installed bioio plugins.
 
         Uses entry_points for fast lookup without loading plugins.
 
         Returns
         -------
-        set of str
-            Set of installed plugin names.
+        frozenset of str
+            Installed plugin names, shared across all managers.
         """
         return get_installed_plugins()
 
     @property
-    def suggested_plugins(self) -> list[str]:
+    def suggested_plugins(self) -> tuple[str, ...]:
         """Get plugin names that could read the current file (installed or not).
 
         Based on file extension, returns all plugin names that declare support
@@ -84,18 +94,13 @@ class ReaderPluginManager:
 
         Returns
         -------
-        list of str
-            List of plugin names (e.g., ['bioio-czi']).
+        tuple of str
+            Plugin names (e.g., ('bioio-czi', 'bioio-bioformats')).
         """
-        if not self.path:
-            return []
-
-        from ._utils import suggest_plugins_for_path
-
-        return suggest_plugins_for_path(self.path)
+        return self._suggested
 
     @property
-    def installable_plugins(self) -> list[str]:
+    def installable_plugins(self) -> tuple[str, ...]:
         """Get non-core plugin names that aren't installed but could read the file.
 
         This is the key property for suggesting plugins to install. It filters
@@ -103,22 +108,23 @@ class ReaderPluginManager:
 
         Returns
         -------
-        list of str
-            List of plugin names that should be installed.
-            Empty list if no path is set or all suitable plugins are installed.
+        tuple of str
+            Plugin names that should be installed, in suggestion order.
+            Empty if no path is set or all suitable plugins are installed.
         """
-        from ._utils import BIOIO_PLUGINS
-
         suggested = self.suggested_plugins
-        installed = self.installed_plugins
+        # Unknown extension (or no path): nothing to filter
+        if not suggested:
+            return ()
 
-        # Filter out core plugins and installed plugins
-        return [
+        excluded = CORE_PLUGINS | self.installed_plugins
+
+        # Filter out core and installed plugins, keeping suggestion order
+        return tuple(
             plugin_name
             for plugin_name in suggested
-            if not BIOIO_PLUGINS.get(plugin_name, {}).get('core', False)
-            and plugin_name not in installed
-        ]
+            if plugin_name not in excluded
+        )
 
     def get_installation_message(self) -> str:
         """Generate helpful message for missing plugins.
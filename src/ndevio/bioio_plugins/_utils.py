@@ -5,6 +5,8 @@ plugin discovery. The ReaderPluginManager uses these utilities internally.
 
 Public API:
     BIOIO_PLUGINS - Dict of all bioio plugins and their file extensions
+    PLUGIN_NAMES - Tuple of all bioio plugin names, in registry order
+    CORE_PLUGINS - Frozenset of plugins bundled with ndevio
     suggest_plugins_for_path() - Get list of suggested plugins by file extension
     get_reader_by_name() - Import and return Reader class from plugin name
 
@@ -30,6 +32,7 @@ Example:
 
 from __future__ import annotations
 
+import functools
 import importlib
 import logging
 from typing import TYPE_CHECKING
@@ -40,6 +43,7 @@ from ._extensions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
     from bioio_base.reader import Reader
@@ -128,37 +132,61 @@ BIOIO_PLUGINS = {
     },
 }
 
-# Map extensions to plugin names for quick lookup
-_EXTENSION_TO_PLUGIN = {}
+# Plugin names in registry order, for widgets that list every plugin
+PLUGIN_NAMES: tuple[str, ...] = tuple(BIOIO_PLUGINS)
+
+# Plugins bundled with ndevio, never suggested for installation
+CORE_PLUGINS: frozenset[str] = frozenset(
+    name for name, info in BIOIO_PLUGINS.items() if info.get('core', False)
+)
+
+# Map extensions to plugin names for quick lookup, frozen to tuples so
+# lookups can be handed out without copying
+_extension_to_plugin: dict[str, list[str]] = {}
 for plugin_name, info in BIOIO_PLUGINS.items():
     for ext in info['extensions']:
-        if ext not in _EXTENSION_TO_PLUGIN:
-            _EXTENSION_TO_PLUGIN[ext] = []
-        _EXTENSION_TO_PLUGIN[ext].append(plugin_name)
+        _extension_to_plugin.setdefault(ext, []).append(plugin_name)
+_EXTENSION_TO_PLUGIN: dict[str, tuple[str, ...]] = {
+    ext: tuple(plugins) for ext, plugins in _extension_to_plugin.items()
+}
+del _extension_to_plugin
+
+# Compound extensions (.ome.tiff, .tiles.ome.tif, ...) in registry order,
+# checked before the simple suffix lookup in suggest_plugins_for_path
+_COMPOUND_EXTENSIONS = tuple(
+    (ext, plugin_name)
+    for plugin_name, info in BIOIO_PLUGINS.items()
+    for ext in info['extensions']
+    if ext.startswith('.') and ext.count('.') > 1
+)
 
 
-def get_installed_plugins() -> set[str]:
+@functools.cache
+def get_installed_plugins() -> frozenset[str]:
     """Get names of installed bioio reader plugins.
 
     Uses importlib.metadata entry_points which is fast and doesn't
-    require loading any plugins.
+    require loading any plugins. ``entry_points()`` walks every installed
+    distribution, so the result is cached; the plugin installer widget calls
+    ``get_installed_plugins.cache_clear()`` after a successful install.
 
     Returns
     -------
-    set of str
-        Set of installed plugin names (e.g., {'bioio-ome-tiff', 'bioio-czi'}).
+    frozenset of str
+        Installed plugin names (e.g., {'bioio-ome-tiff', 'bioio-czi'}).
     """
     from importlib.metadata import entry_points
 
-    eps = entry_points(group='bioio.readers')
-    return {ep.name for ep in eps}
+    return frozenset(ep.name for ep in entry_points(group='bioio.readers'))
 
 
+@functools.cache
 def get_reader_by_name(reader_name: str) -> type[Reader]:
     """Import and return Reader class from plugin name.
 
     Converts plugin name (e.g., 'bioio-czi') to module name (e.g., 'bioio_czi')
-    and imports the Reader class.
+    and imports the Reader class. Successful lookups are cached per name;
+    failed imports are not, so a plugin installed later is still found.
 
     Parameters
     ----------
@@ -192,9 +220,9 @@ def get_reader_by_name(reader_name: str) -> type[Reader]:
 
 def format_plugin_installation_message(
     filename: str,
-    suggested_plugins: list[str],
-    installed_plugins: set[str],
-    installable_plugins: list[str],
+    suggested_plugins: Sequence[str],
+    installed_plugins: set[str] | frozenset[str],
+    installable_plugins: Sequence[str],
 ) -> str:
     """Generate installation message for bioio plugins.
 
@@ -205,11 +233,11 @@ def format_plugin_installation_message(
     ----------
     filename : str
         Name of the file that couldn't be read
-    suggested_plugins : list of str
+    suggested_plugins : sequence of str
         Names of all plugins that could read this file type
     installed_plugins : set of str
         Names of plugins that are already installed
-    installable_plugins : list of str
+    installable_plugins : sequence of str
         Names of non-core plugins that aren't installed but could read the file
 
     Returns
@@ -298,31 +326,20 @@ def suggest_plugins_for_path(path: Path | str) -> list[str]:
     filename = path.name.lower()
 
     # Check compound extensions first (.ome.tiff, .tiles.ome.tif, etc.)
-    for plugin_name, info in BIOIO_PLUGINS.items():
-        for ext in info['extensions']:
-            # Compound extension: multiple dots and matches filename
-            if (
-                ext.startswith('.')
-                and len(ext.split('.')) > 2
-                and filename.endswith(ext)
-            ):
-                return [plugin_name]
+    for ext, plugin_name in _COMPOUND_EXTENSIONS:
+        if filename.endswith(ext):
+            return [plugin_name]
 
     # Fall back to simple extension matching
-    file_ext = path.suffix.lower()
-
-    if file_ext in _EXTENSION_TO_PLUGIN:
-        return _EXTENSION_TO_PLUGIN[file_ext].copy()
-
-    return []
+    return list(_EXTENSION_TO_PLUGIN.get(path.suffix.lower(), ()))
 
 
-def _format_plugin_list(plugin_names: list[str]) -> str:
+def _format_plugin_list(plugin_names: Sequence[str]) -> str:
     """Format a list of plugin names with installation instructions.
 
     Parameters
     ----------
-    plugin_names : list of str
+    plugin_names : sequence of str
         Plugin names to format (e.g., ['bioio-czi', 'bioio-lif'])
 
     Returns
@@ -335,15 +352,15 @@ def _format_plugin_list(plugin_names: list[str]) -> str:
 
     lines = []
     for plugin_name in plugin_names:
+        # Skip core plugins (already installed with ndevio)
+        if plugin_name in CORE_PLUGINS:
+            continue
+
         # Look up plugin info from registry
         info = BIOIO_PLUGINS.get(plugin_name)
         if not info:
             continue
 
-        # Skip core plugins (already installed with ndevio)
-        if info.get('core', False):
-            continue
-
         lines.append(f'  • {plugin_name}')
         lines.append(f'    {info["description"]}')
         if info.get('note'):
@@ -128,10 +128,19 @@ class nImage(BioImage):
             self._is_remote = False
             return
 
+        source = str(image)
+        if isinstance(image, Path) or (
+            '://' not in source and '::' not in source
+        ):
+            # Plain local path: resolve it the way fsspec's LocalFileSystem
+            # would, without building a filesystem object.
+            self.path = str(Path(source).expanduser().absolute())
+            self._is_remote = False
+            return
+
         import fsspec
         from fsspec.implementations.local import LocalFileSystem
 
-        source = str(image)
         fs, resolved = fsspec.url_to_fs(source)
         if isinstance(fs, LocalFileSystem):
             # Normalise file:// URIs and any platform variations to an
@@ -147,18 +156,8 @@ class nImage(BioImage):
         """Return True if the uncompressed image fits comfortably in RAM."""
         if self.path is None:
             return True
-
-        from ndev_settings import get_settings
-        from psutil import virtual_memory
-
-        max_bytes = (
-            float(getattr(get_settings().ndevio_reader, 'max_in_mem_gb', 8.0))  # type: ignore[attr-defined]
-            * 1e9
-        )
-        available = int(virtual_memory().available)
         # xr.DataArray.nbytes = shape × dtype.itemsize — no IO, dask-safe
-        uncompressed = self.xarray_dask_data.nbytes
-        return uncompressed <= max_bytes and uncompressed < 0.3 * available
+        return _nbytes_fit_in_memory(self.xarray_dask_data.nbytes)
 
     @property
     def _use_dask(self) -> bool:
@@ -571,6 +570,10 @@ class nImage(BioImage):
         channel_names = self.channel_names
         channel_axis = ref.dims.index(channel_dim)
         total_channels = ref.shape[channel_axis]
+        path_stem = self.path_stem
+        # Leading full slices up to the channel axis; trailing dims are
+        # implied, so each channel is a view (numpy) or a lazy slice (dask)
+        leading = (slice(None),) * channel_axis
 
         tuples: list[LayerDataTuple] = []
         for i in range(total_channels):
@@ -579,13 +582,11 @@ class nImage(BioImage):
                 global_override=layer_type,
                 channel_types=channel_types,
                 channel_name=channel_name,
-                path_stem=self.path_stem,
+                path_stem=path_stem,
             )
 
             # Slice along channel axis for each resolution level
-            slices: list[slice | int] = [slice(None)] * ref.ndim
-            slices[channel_axis] = i
-            channel_data = [arr[tuple(slices)] for arr in data]
+            channel_data = [arr[(*leading, i)] for arr in data]
 
             extra_kwargs = (
                 channel_kwargs.get(channel_name) if channel_kwargs else None
@@ -609,6 +610,23 @@ class nImage(BioImage):
         return tuples
 
 
+def _nbytes_fit_in_memory(nbytes: int) -> bool:
+    """Return True if ``nbytes`` of uncompressed data fit comfortably in RAM.
+
+    The limit is the smaller of the ``max_in_mem_gb`` setting (8 GB if the
+    persisted settings predate it) and 30% of currently available memory.
+    """
+    from ndev_settings import get_settings
+    from psutil import virtual_memory
+
+    max_bytes = (
+        float(getattr(get_settings().ndevio_reader, 'max_in_mem_gb', 8.0))  # type: ignore[attr-defined]
+        * 1e9
+    )
+    available = int(virtual_memory().available)
+    return nbytes <= max_bytes and nbytes < 0.3 * available
+
+
 def _prepare_bioimage_init_kwargs(
     kwargs: dict[str, Any],
 ) -> tuple[dict[str, Any], dict[str, Any]]:
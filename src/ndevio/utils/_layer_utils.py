@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -36,10 +38,22 @@ FILE_LABEL_KEYWORDS = frozenset(
 )
 
 
-def _contains_label_keyword(value: str, keywords: frozenset[str]) -> bool:
-    """Return whether a string contains any keyword in a keyword set."""
-    value_lower = value.lower()
-    return any(keyword in value_lower for keyword in keywords)
+def _keyword_pattern(keywords: frozenset[str]) -> re.Pattern[str]:
+    """Compile a case-insensitive pattern matching any of the keywords."""
+    return re.compile(
+        '|'.join(re.escape(keyword) for keyword in sorted(keywords)),
+        re.IGNORECASE,
+    )
+
+
+_CHANNEL_LABEL_PATTERN = _keyword_pattern(CHANNEL_LABEL_KEYWORDS)
+_FILE_LABEL_PATTERN = _keyword_pattern(FILE_LABEL_KEYWORDS)
+
+
+@functools.lru_cache(maxsize=1024)
+def _contains_label_keyword(value: str, pattern: re.Pattern[str]) -> bool:
+    """Return whether a string contains any keyword matched by a pattern."""
+    return pattern.search(value) is not None
 
 
 def resolve_layer_type(
@@ -80,11 +94,14 @@ def resolve_layer_type(
     """
     if global_override is not None:
         return global_override
-    if channel_types and channel_name in channel_types:
-        return channel_types[channel_name]
-    if _contains_label_keyword(channel_name, CHANNEL_LABEL_KEYWORDS):
-        return 'labels'
-    if path_stem and _contains_label_keyword(path_stem, FILE_LABEL_KEYWORDS):
+    if (
+        channel_types
+        and (channel_type := channel_types.get(channel_name)) is not None
+    ):
+        return channel_type
+    if _contains_label_keyword(channel_name, _CHANNEL_LABEL_PATTERN) or (
+        path_stem and _contains_label_keyword(path_stem, _FILE_LABEL_PATTERN)
+    ):
         return 'labels'
     return 'image'
 
@@ -139,29 +156,30 @@ def build_layer_tuple(
     """
     from ._colormap_utils import get_colormap_for_channel
 
-    layer_kwargs: dict = {
+    if rgb:
+        style_kwargs = {'rgb': True}
+    elif layer_type == 'image':
+        # Add colormap/blending for non-RGB images
+        style_kwargs = {
+            'colormap': get_colormap_for_channel(channel_idx, total_channels),
+            'blending': (
+                'additive'
+                if channel_idx > 0 and total_channels > 1
+                else 'translucent_no_depth'
+            ),
+        }
+    else:
+        style_kwargs = {}
+
+    # Build the kwargs in one merge; extra overrides are applied last
+    layer_kwargs = {
         'name': name,
         'metadata': metadata,
         'scale': scale,
         'axis_labels': axis_labels,
         'units': units,
+        **style_kwargs,
+        **(extra_kwargs or {}),
     }
 
-    if rgb:
-        layer_kwargs['rgb'] = True
-    elif layer_type == 'image':
-        # Add colormap/blending for non-RGB images
-        layer_kwargs['colormap'] = get_colormap_for_channel(
-            channel_idx, total_channels
-        )
-        layer_kwargs['blending'] = (
-            'additive'
-            if channel_idx > 0 and total_channels > 1
-            else 'translucent_no_depth'
-        )
-
-    # Apply extra overrides last
-    if extra_kwargs:
-        layer_kwargs.update(extra_kwargs)
-
     return (data, layer_kwargs, layer_type)  # type: ignore[return-value]
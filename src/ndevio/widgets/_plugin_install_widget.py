@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING
 
 from magicgui.widgets import ComboBox, Container, Label, PushButton
 
-from ..bioio_plugins._utils import BIOIO_PLUGINS
+from ..bioio_plugins._utils import PLUGIN_NAMES
 
 if TYPE_CHECKING:
     from ..bioio_plugins._manager import ReaderPluginManager
@@ -95,11 +95,9 @@ class PluginInstallerWidget(Container):
         self._info_label = Label(value='Select a plugin to install:')
         self.append(self._info_label)
 
-        plugin_names = list(BIOIO_PLUGINS.keys())
-
         self._plugin_select = ComboBox(
             label='Plugin',
-            choices=plugin_names,
+            choices=PLUGIN_NAMES,
             value=None,
             nullable=True,
         )
@@ -156,6 +154,11 @@ class PluginInstallerWidget(Container):
                 return
 
             if exit_code == 0:
+                # The installed-plugins lookup is cached per process; drop it
+                # so managers created from now on see the new plugin
+                from ..bioio_plugins._utils import get_installed_plugins
+
+                get_installed_plugins.cache_clear()
                 self._status_label.value = (
                     f'✓ Successfully installed {plugin_name}!\n\n'
                     '⚠ It is recommended to restart napari.'
@@ -1,11 +1,143 @@
 """Pytest configuration for ndevio tests."""
 
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
+if TYPE_CHECKING:
+    from ndevio import nImage
+    from ndevio.bioio_plugins._manager import ReaderPluginManager
 
-@pytest.fixture
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        '--run-network',
+        action='store_true',
+        default=False,
+        help='run tests marked with @pytest.mark.network',
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip network tests unless ``--run-network`` is given."""
+    if config.getoption('--run-network'):
+        return
+    skip_network = pytest.mark.skip(reason='needs --run-network')
+    for item in items:
+        if 'network' in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope='session')
 def resources_dir() -> Path:
     """Return path to test resources directory."""
     return Path(__file__).parent / 'resources'
+
+
+@pytest.fixture(scope='session')
+def resource_file(resources_dir: Path) -> Callable[[str], Path]:
+    """Return a memoized lookup of test resource paths by filename.
+
+    Parametrized tests ask for the same handful of files many times; each
+    name is joined onto ``resources_dir`` once and the ``Path`` is reused.
+    """
+    cache: dict[str, Path] = {}
+
+    def _get(name: str) -> Path:
+        path = cache.get(name)
+        if path is None:
+            path = cache[name] = resources_dir / name
+        return path
+
+    return _get
+
+
+@pytest.fixture(scope='session')
+def tiff_manager() -> ReaderPluginManager:
+    """Return a ReaderPluginManager for a TIFF path, shared by the session.
+
+    The manager only holds its path and the suggestions derived from it, so
+    sharing one instance across tests is safe.
+    """
+    from ndevio.bioio_plugins._manager import ReaderPluginManager
+
+    return ReaderPluginManager('test.tiff')
+
+
+@pytest.fixture(scope='session')
+def czi_manager() -> ReaderPluginManager:
+    """Return a ReaderPluginManager for a CZI path, shared by the session."""
+    from ndevio.bioio_plugins._manager import ReaderPluginManager
+
+    return ReaderPluginManager('test.czi')
+
+
+@pytest.fixture(scope='session')
+def cells3d_manager(resources_dir: Path) -> ReaderPluginManager:
+    """Return a ReaderPluginManager for the real cells3d TIFF."""
+    from ndevio.bioio_plugins._manager import ReaderPluginManager
+
+    return ReaderPluginManager(resources_dir / 'cells3d2ch_legacy.tiff')
+
+
+@pytest.fixture(scope='session')
+def cells3d_img(resources_dir: Path) -> nImage:
+    """Shared nImage of ``cells3d2ch_legacy.tiff`` for read-only tests.
+
+    Opening the OME-TIFF (reader init and OME-XML parsing) dominates these
+    tests, so it happens once per session. Tests that need fresh lazy state
+    should use ``cells3d_img_factory`` instead.
+    """
+    from ndevio import nImage
+
+    return nImage(resources_dir / 'cells3d2ch_legacy.tiff')
+
+
+@pytest.fixture
+def cells3d_img_factory(cells3d_img: nImage) -> Callable[[], nImage]:
+    """Return a factory of shallow copies of ``cells3d_img``.
+
+    Copies share the opened reader and parsed metadata but start with the
+    lazy ``reference_xarray``/``layer_data`` caches unset, so tests can
+    exercise or mutate them without leaking state into the shared image.
+    """
+
+    def _make() -> nImage:
+        img = copy.copy(cells3d_img)
+        img._reference_xarray = None
+        img._layer_data = None
+        img._use_dask_cache = None
+        return img
+
+    return _make
+
+
+@pytest.fixture
+def cells3d_img_ome_error(
+    cells3d_img: nImage,
+) -> Callable[[Exception], nImage]:
+    """Return a factory of ``cells3d_img`` copies whose OME metadata raises.
+
+    The copy's class is a throwaway subclass overriding ``ome_metadata``, so
+    the ``nImage`` descriptor itself is never patched and other tests (or
+    xdist workers) can't observe the failure.
+    """
+
+    def _make(exc: Exception) -> nImage:
+        class _OmeErrorImage(type(cells3d_img)):
+            @property
+            def ome_metadata(self):
+                raise exc
+
+        img = copy.copy(cells3d_img)
+        img.__class__ = _OmeErrorImage
+        return img
+
+    return _make
@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import logging
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
+import pytest
 
-def _make_zarr_reader(multiscales: list) -> MagicMock:
-    """Return a mock that looks like a ``bioio_ome_zarr.Reader`` instance."""
-    reader = MagicMock()
-    reader.__module__ = 'bioio_ome_zarr.reader'
-    reader._multiscales_metadata = multiscales
-    return reader
+from ndevio import nImage
+from ndevio.bioio_plugins._compatibility import (
+    _normalize_v03_string_axes,
+    _warn_if_no_coordinate_transforms,
+)
+
+
+class _ZarrReaderStub:
+    """Stand-in for ``bioio_ome_zarr.Reader``.
+
+    The compatibility helpers only read ``__module__`` and
+    ``_multiscales_metadata``, so a slotted class avoids ``MagicMock``'s
+    per-attribute child-mock machinery.
+    """
+
+    __slots__ = ('_multiscales_metadata',)
+    __module__ = 'bioio_ome_zarr.reader'
+
+    def __init__(self, multiscales: list) -> None:
+        self._multiscales_metadata = multiscales
+
+
+def _make_zarr_reader(multiscales: list) -> _ZarrReaderStub:
+    """Return a stub that looks like a ``bioio_ome_zarr.Reader`` instance."""
+    return _ZarrReaderStub(multiscales)
 
 
 def _make_v01_multiscales(version: str = '0.1') -> list:
@@ -62,102 +82,45 @@ def _make_v04_multiscales() -> list:
 class TestWarnIfNoCoordinateTransforms:
     """Unit tests for _warn_if_no_coordinate_transforms."""
 
-    def test_v01_emits_warning(self, caplog):
-        """v0.1 metadata (no coordinateTransformations) triggers a warning."""
-        from ndevio.bioio_plugins._compatibility import (
-            _warn_if_no_coordinate_transforms,
-        )
-
-        reader = _make_zarr_reader(_make_v01_multiscales('0.1'))
-
-        with caplog.at_level(
-            logging.WARNING, logger='ndevio.bioio_plugins._compatibility'
-        ):
-            _warn_if_no_coordinate_transforms(reader)
-
-        assert len(caplog.records) == 1
-        assert '0.1' in caplog.records[0].message
-        assert 'coordinateTransformations' in caplog.records[0].message
-        assert 'scale=1.0' in caplog.records[0].message
-
-    def test_v02_emits_warning(self, caplog):
-        """v0.2 metadata also triggers a warning."""
-        from ndevio.bioio_plugins._compatibility import (
-            _warn_if_no_coordinate_transforms,
-        )
-
-        reader = _make_zarr_reader(_make_v01_multiscales('0.2'))
-
-        with caplog.at_level(
-            logging.WARNING, logger='ndevio.bioio_plugins._compatibility'
-        ):
-            _warn_if_no_coordinate_transforms(reader)
-
-        assert len(caplog.records) == 1
-        assert '0.2' in caplog.records[0].message
-
-    def test_v03_with_transforms_no_warning(self, caplog):
-        """v0.3 metadata (has coordinateTransformations) emits no warning."""
-        from ndevio.bioio_plugins._compatibility import (
-            _warn_if_no_coordinate_transforms,
-        )
-
-        reader = _make_zarr_reader(_make_v03_string_axes_multiscales())
-
-        with caplog.at_level(
-            logging.WARNING, logger='ndevio.bioio_plugins._compatibility'
-        ):
-            _warn_if_no_coordinate_transforms(reader)
-
-        assert len(caplog.records) == 0
-
-    def test_v04_no_warning(self, caplog):
-        """v0.4 metadata emits no warning."""
-        from ndevio.bioio_plugins._compatibility import (
-            _warn_if_no_coordinate_transforms,
-        )
-
-        reader = _make_zarr_reader(_make_v04_multiscales())
-
+    @pytest.fixture(autouse=True)
+    def _capture_compat_warnings(self, caplog):
+        """Capture WARNING records from the compatibility logger."""
         with caplog.at_level(
             logging.WARNING, logger='ndevio.bioio_plugins._compatibility'
         ):
-            _warn_if_no_coordinate_transforms(reader)
-
-        assert len(caplog.records) == 0
-
-    def test_empty_multiscales_no_warning(self, caplog):
-        """Empty multiscales list does not raise and emits no warning."""
-        from ndevio.bioio_plugins._compatibility import (
-            _warn_if_no_coordinate_transforms,
-        )
-
-        reader = _make_zarr_reader([])
-
-        with caplog.at_level(
-            logging.WARNING, logger='ndevio.bioio_plugins._compatibility'
-        ):
-            _warn_if_no_coordinate_transforms(reader)
-
-        assert len(caplog.records) == 0
-
-    def test_unknown_version_in_warning(self, caplog):
-        """When version key is missing the warning still fires with a fallback string."""
-        from ndevio.bioio_plugins._compatibility import (
-            _warn_if_no_coordinate_transforms,
-        )
-
-        # No 'version' key, no 'coordinateTransformations'
-        multiscales = [{'datasets': [{'path': '0'}]}]
+            yield
+        caplog.clear()
+
+    @pytest.mark.parametrize(
+        ('multiscales', 'expected_substr'),
+        [
+            # v0.1/v0.2 have no coordinateTransformations -> warning
+            pytest.param(_make_v01_multiscales('0.1'), '0.1', id='v01'),
+            pytest.param(_make_v01_multiscales('0.2'), '0.2', id='v02'),
+            # v0.3+ have coordinateTransformations -> no warning
+            pytest.param(_make_v03_string_axes_multiscales(), None, id='v03'),
+            pytest.param(_make_v04_multiscales(), None, id='v04'),
+            pytest.param([], None, id='empty'),
+            # missing 'version' key still warns, with a fallback string
+            pytest.param(
+                [{'datasets': [{'path': '0'}]}], 'unknown', id='unknown'
+            ),
+        ],
+    )
+    def test_warning_by_version(self, caplog, multiscales, expected_substr):
+        """Only stores without coordinateTransformations emit one warning."""
         reader = _make_zarr_reader(multiscales)
+        _warn_if_no_coordinate_transforms(reader)
 
-        with caplog.at_level(
-            logging.WARNING, logger='ndevio.bioio_plugins._compatibility'
-        ):
-            _warn_if_no_coordinate_transforms(reader)
+        if expected_substr is None:
+            assert len(caplog.records) == 0
+            return
 
         assert len(caplog.records) == 1
-        assert 'unknown' in caplog.records[0].message.lower()
+        message = caplog.records[0].message
+        assert expected_substr in message.lower()
+        assert 'coordinateTransformations' in message
+        assert 'scale=1.0' in message
 
 
 class TestNormalizeV03StringAxes:
@@ -165,10 +128,6 @@ class TestNormalizeV03StringAxes:
 
     def test_string_axes_normalized(self):
         """v0.3 string-axes are converted to v0.4 dict-axes."""
-        from ndevio.bioio_plugins._compatibility import (
-            _normalize_v03_string_axes,
-        )
-
         reader = _make_zarr_reader(_make_v03_string_axes_multiscales())
         _normalize_v03_string_axes(reader)
 
@@ -180,24 +139,15 @@ class TestNormalizeV03StringAxes:
 
     def test_dict_axes_untouched(self):
         """v0.4 dict-axes are not modified."""
-        from ndevio.bioio_plugins._compatibility import (
-            _normalize_v03_string_axes,
-        )
-
         reader = _make_zarr_reader(_make_v04_multiscales())
-        import copy
-
-        original = copy.deepcopy(reader._multiscales_metadata[0]['axes'])
+        # axes entries are flat {str: str} dicts, so a shallow copy suffices
+        original = [dict(ax) for ax in reader._multiscales_metadata[0]['axes']]
         _normalize_v03_string_axes(reader)
 
         assert reader._multiscales_metadata[0]['axes'] == original
 
     def test_empty_multiscales(self):
         """No crash on empty multiscales."""
-        from ndevio.bioio_plugins._compatibility import (
-            _normalize_v03_string_axes,
-        )
-
         reader = _make_zarr_reader([])
         _normalize_v03_string_axes(reader)  # should not raise
 
@@ -207,8 +157,6 @@ class TestNImageCompatibilityGuard:
 
     def test_non_zarr_reader_skips_check(self, resources_dir):
         """A TIFF-backed nImage never calls apply_ome_zarr_compat_patches."""
-        from ndevio import nImage
-
         with patch(
             'ndevio.bioio_plugins._compatibility.apply_ome_zarr_compat_patches'
         ) as mock_check:
@@ -218,8 +166,6 @@ class TestNImageCompatibilityGuard:
 
     def test_zarr_reader_calls_check(self, resources_dir):
         """A zarr-backed nImage calls apply_ome_zarr_compat_patches exactly once."""
-        from ndevio import nImage
-
         with patch(
             'ndevio.bioio_plugins._compatibility.apply_ome_zarr_compat_patches'
         ) as mock_check:
@@ -9,14 +9,21 @@ For ReaderPluginManager tests, see test_plugin_manager.py
 For widget tests, see test_plugin_installer_widget.py
 """
 
+from napari_plugin_manager.qt_package_installer import NapariInstallerQueue
+
+from ndevio.bioio_plugins import _installer
+from ndevio.bioio_plugins._installer import (
+    get_installer_queue,
+    install_plugin,
+    verify_plugin_installed,
+)
+
 
 class TestInstallPlugin:
     """Test install_plugin function."""
 
     def test_returns_job_id(self):
         """Test that install_plugin returns a job ID."""
-        from ndevio.bioio_plugins._installer import install_plugin
-
         # This will queue the installation but not actually run it
         job_id = install_plugin('bioio-imageio')
 
@@ -28,20 +35,14 @@ class TestVerifyPluginInstalled:
 
     def test_installed_dependency(self):
         """Test verification of an installed package (bioio is a dependency)."""
-        from ndevio.bioio_plugins._installer import verify_plugin_installed
-
         assert verify_plugin_installed('bioio')
 
     def test_not_installed_plugin(self):
         """Test verification of a plugin that isn't installed."""
-        from ndevio.bioio_plugins._installer import verify_plugin_installed
-
         assert not verify_plugin_installed('bioio-nonexistent-plugin-12345')
 
     def test_converts_hyphen_to_underscore(self):
         """Test that plugin name is correctly converted to module name."""
-        from ndevio.bioio_plugins._installer import verify_plugin_installed
-
         # bioio-base should be installed, converts to bioio_base
         result = verify_plugin_installed('bioio-base')
         assert isinstance(result, bool)
@@ -52,19 +53,11 @@ class TestGetInstallerQueue:
 
     def test_returns_queue_instance(self):
         """Test that get_installer_queue returns the correct type."""
-        from napari_plugin_manager.qt_package_installer import (
-            NapariInstallerQueue,
-        )
-
-        from ndevio.bioio_plugins._installer import get_installer_queue
-
         queue = get_installer_queue()
         assert isinstance(queue, NapariInstallerQueue)
 
     def test_singleton_behavior(self):
         """Test that get_installer_queue returns the same instance."""
-        from ndevio.bioio_plugins._installer import get_installer_queue
-
         queue1 = get_installer_queue()
         queue2 = get_installer_queue()
 
@@ -72,9 +65,6 @@ class TestGetInstallerQueue:
 
     def test_queue_can_be_reset(self):
         """Test that queue can be reset for testing purposes."""
-        from ndevio.bioio_plugins import _installer
-        from ndevio.bioio_plugins._installer import get_installer_queue
-
         queue1 = get_installer_queue()
 
         # Reset the global
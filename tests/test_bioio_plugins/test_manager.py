@@ -4,120 +4,133 @@ Note: Extension-to-plugin mapping is tested in test_bioio_plugin_utils.py
 via TestSuggestPluginsForPath. We trust those unit tests and don't duplicate here.
 """
 
-from unittest.mock import patch
+import subprocess
+import sys
+from types import SimpleNamespace
 
 import pytest
 from bioio_base.exceptions import UnsupportedFileFormatError
 
+from ndevio.bioio_plugins._manager import (
+    ReaderPluginManager,
+    raise_unsupported_with_suggestions,
+)
+from ndevio.bioio_plugins._utils import get_installed_plugins
+
+
+def _settings(*, suggest_reader_plugins: bool) -> SimpleNamespace:
+    """Minimal stand-in for ``ndev_settings.get_settings()``."""
+    return SimpleNamespace(
+        ndevio_reader=SimpleNamespace(
+            suggest_reader_plugins=suggest_reader_plugins
+        )
+    )
+
 
 class TestRaiseWithSuggestions:
     """Tests for raise_unsupported_with_suggestions function."""
 
-    def test_raises_with_suggestions_enabled(self):
+    def test_raises_with_suggestions_enabled(self, monkeypatch):
         """Test error message includes suggestions when enabled."""
-        from ndevio.bioio_plugins._manager import (
-            raise_unsupported_with_suggestions,
-        )
+        settings = _settings(suggest_reader_plugins=True)
+        monkeypatch.setattr('ndev_settings.get_settings', lambda: settings)
 
-        with patch('ndev_settings.get_settings') as mock_settings:
-            mock_settings.return_value.ndevio_reader.suggest_reader_plugins = (
-                True
-            )
+        with pytest.raises(UnsupportedFileFormatError) as exc_info:
+            raise_unsupported_with_suggestions('test.czi')
 
-            with pytest.raises(UnsupportedFileFormatError) as exc_info:
-                raise_unsupported_with_suggestions('test.czi')
+        error_msg = str(exc_info.value)
+        assert 'bioio-czi' in error_msg
 
-            error_msg = str(exc_info.value)
-            assert 'bioio-czi' in error_msg
-
-    def test_raises_without_suggestions_when_disabled(self):
+    def test_raises_without_suggestions_when_disabled(self, monkeypatch):
         """Test error message has no suggestions when disabled."""
-        from ndevio.bioio_plugins._manager import (
-            raise_unsupported_with_suggestions,
-        )
+        settings = _settings(suggest_reader_plugins=False)
+        monkeypatch.setattr('ndev_settings.get_settings', lambda: settings)
+
+        with pytest.raises(UnsupportedFileFormatError) as exc_info:
+            raise_unsupported_with_suggestions('test.czi')
 
-        with patch('ndev_settings.get_settings') as mock_settings:
-            mock_settings.return_value.ndevio_reader.suggest_reader_plugins = (
-                False
-            )
+        error_msg = str(exc_info.value)
+        # Should still mention the file but not include installation message
+        assert 'test.czi' in error_msg
 
-            with pytest.raises(UnsupportedFileFormatError) as exc_info:
-                raise_unsupported_with_suggestions('test.czi')
 
-            error_msg = str(exc_info.value)
-            # Should still mention the file but not include installation message
-            assert 'test.czi' in error_msg
+def test_manager_import_is_lightweight():
+    """Test importing the manager does not pull in bioio, psutil or napari."""
+    code = (
+        'import sys, ndevio.bioio_plugins._manager; '
+        "heavy = {'bioio', 'bioio_base', 'psutil', 'napari'}; "
+        'print(sorted(heavy & set(sys.modules)))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == '[]'
 
 
 class TestGetInstalledPlugins:
     """Tests for get_installed_plugins module-level function."""
 
-    def test_returns_set_of_strings(self):
-        """Test that get_installed_plugins returns a set of strings."""
-        from ndevio.bioio_plugins._utils import get_installed_plugins
-
+    def test_returns_frozenset_of_strings(self):
+        """Test that get_installed_plugins returns a frozenset of strings."""
         result = get_installed_plugins()
 
-        assert isinstance(result, set)
+        assert isinstance(result, frozenset)
         for item in result:
             assert isinstance(item, str)
 
     def test_includes_core_plugins(self):
         """Test that installed plugins include core bioio plugins."""
-        from ndevio.bioio_plugins._utils import get_installed_plugins
-
         result = get_installed_plugins()
 
         # At minimum, one core plugin should be present
         core_plugins = {'bioio-ome-tiff', 'bioio-ome-zarr', 'bioio-tifffile'}
         assert len(result & core_plugins) > 0
 
+    def test_entry_point_scan_is_cached(self, monkeypatch):
+        """Test that repeated calls do not rescan the entry points."""
+        import importlib.metadata
 
-class TestReaderPluginManager:
-    """Tests for ReaderPluginManager properties and methods."""
-
-    def test_installed_plugins_returns_set(self):
-        """Test that installed_plugins returns a set of plugin names."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-
-        manager = ReaderPluginManager('test.tiff')
-
-        assert isinstance(manager.installed_plugins, set)
-        assert len(manager.installed_plugins) > 0
+        first = get_installed_plugins()
 
-    def test_installed_plugins_matches_module_function(self):
-        """Test installed_plugins matches get_installed_plugins()."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-        from ndevio.bioio_plugins._utils import get_installed_plugins
-
-        manager = ReaderPluginManager('test.tiff')
-
-        assert manager.installed_plugins == get_installed_plugins()
+        def fail(**kwargs):
+            raise AssertionError('entry points were rescanned')
 
-    def test_suggested_plugins_for_tiff(self):
-        """Test suggested_plugins returns relevant plugins for tiff."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
+        monkeypatch.setattr(importlib.metadata, 'entry_points', fail)
+        assert get_installed_plugins() is first
 
-        manager = ReaderPluginManager('test.tiff')
-        suggested = manager.suggested_plugins
 
-        assert 'bioio-ome-tiff' in suggested
-        assert 'bioio-tifffile' in suggested
-
-    def test_suggested_plugins_for_czi(self):
-        """Test suggested_plugins returns bioio-czi for .czi files."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-
-        manager = ReaderPluginManager('test.czi')
-        suggested = manager.suggested_plugins
+class TestReaderPluginManager:
+    """Tests for ReaderPluginManager properties and methods."""
 
-        assert 'bioio-czi' in suggested
+    def test_installed_plugins_returns_frozenset(self, tiff_manager):
+        """Test that installed_plugins returns a frozenset of plugin names."""
+        assert isinstance(tiff_manager.installed_plugins, frozenset)
+        assert len(tiff_manager.installed_plugins) > 0
 
-    def test_installable_excludes_installed_and_core(self):
+    def test_installed_plugins_matches_module_function(self, tiff_manager):
+        """Test installed_plugins matches get_installed_plugins()."""
+        assert tiff_manager.installed_plugins == get_installed_plugins()
+
+    @pytest.mark.parametrize(
+        ('manager_fixture', 'expected'),
+        [
+            ('tiff_manager', {'bioio-ome-tiff', 'bioio-tifffile'}),
+            ('czi_manager', {'bioio-czi'}),
+        ],
+        ids=['tiff', 'czi'],
+    )
+    def test_suggested_plugins(self, request, manager_fixture, expected):
+        """Test suggested_plugins returns the relevant plugins for a path."""
+        manager = request.getfixturevalue(manager_fixture)
+
+        assert expected <= set(manager.suggested_plugins)
+
+    def test_installable_excludes_installed_and_core(self, tiff_manager):
         """Test installable_plugins excludes installed and core plugins."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-
-        manager = ReaderPluginManager('test.tiff')
+        manager = tiff_manager
         installable = manager.installable_plugins
 
         # Core plugins never in installable
@@ -131,66 +144,54 @@ class TestReaderPluginManager:
         for plugin in installable:
             assert plugin not in installed
 
-    def test_get_installation_message_with_installable(self):
+    def test_get_installation_message_with_installable(self, monkeypatch):
         """Test installation message is generated for installable plugins."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-
         # Mock installed plugins to NOT include bioio-nd2
-        with patch(
+        monkeypatch.setattr(
             'ndevio.bioio_plugins._manager.get_installed_plugins',
-            return_value={'bioio-ome-tiff', 'bioio-tifffile'},
-        ):
-            manager = ReaderPluginManager('test.nd2')
-            message = manager.get_installation_message()
-
-            assert 'bioio-nd2' in message
-            assert 'pip install' in message
+            lambda: frozenset({'bioio-ome-tiff', 'bioio-tifffile'}),
+        )
+        manager = ReaderPluginManager('test.nd2')
+        message = manager.get_installation_message()
 
+        assert 'bioio-nd2' in message
+        assert 'pip install' in message
 
-class TestReaderPluginManagerNoPath:
-    """Tests for ReaderPluginManager edge cases when no path provided."""
+    @pytest.mark.parametrize(
+        'attribute', ['suggested_plugins', 'installable_plugins']
+    )
+    def test_empty_without_path(self, attribute):
+        """Test plugin lists are empty when no path is provided."""
+        assert getattr(ReaderPluginManager(), attribute) == ()
 
-    def test_suggested_plugins_empty_without_path(self):
-        """Test suggested_plugins returns [] without path."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
+    def test_installable_skips_installed_lookup_for_unknown_extension(
+        self, monkeypatch
+    ):
+        """Test unknown extensions skip the installed-plugins lookup."""
 
-        manager = ReaderPluginManager()
-        assert manager.suggested_plugins == []
+        def fail():
+            raise AssertionError('installed plugins were looked up')
 
-    def test_installable_plugins_empty_without_path(self):
-        """Test installable_plugins returns [] without path."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-
-        manager = ReaderPluginManager()
-        assert manager.installable_plugins == []
+        monkeypatch.setattr(
+            'ndevio.bioio_plugins._manager.get_installed_plugins', fail
+        )
+        assert ReaderPluginManager('test.xyz').installable_plugins == ()
 
     def test_get_installation_message_returns_empty(self):
         """Test get_installation_message returns '' without path."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-
         manager = ReaderPluginManager()
         assert manager.get_installation_message() == ''
 
-
-class TestReaderPluginManagerWithRealFiles:
-    """Tests using real files to verify end-to-end behavior."""
-
-    def test_suggested_plugins_for_real_tiff(self, resources_dir):
+    def test_suggested_plugins_for_real_tiff(self, cells3d_manager):
         """Test suggested_plugins with a real TIFF file."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-
-        manager = ReaderPluginManager(resources_dir / 'cells3d2ch_legacy.tiff')
-        suggested = manager.suggested_plugins
+        suggested = cells3d_manager.suggested_plugins
 
         assert 'bioio-ome-tiff' in suggested
         assert 'bioio-tifffile' in suggested
 
-    def test_installed_plugins_includes_core(self, resources_dir):
+    def test_installed_plugins_includes_core(self, cells3d_manager):
         """Test installed_plugins includes core plugins."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-
-        manager = ReaderPluginManager(resources_dir / 'cells3d2ch_legacy.tiff')
-        installed = manager.installed_plugins
+        installed = cells3d_manager.installed_plugins
 
         # At least one core plugin should be installed
         core_plugins = {'bioio-ome-tiff', 'bioio-ome-zarr', 'bioio-tifffile'}
@@ -3,10 +3,18 @@
 This module tests:
 - suggest_plugins_for_path: maps file extensions to bioio plugin names
 - format_plugin_installation_message: formats installation instructions
+- get_reader_by_name: imports a plugin's Reader class by name
 - BIOIO_PLUGINS: the plugin metadata registry
 """
 
 import pytest
+from bioio_ome_tiff import Reader as OmeTiffReader
+
+from ndevio.bioio_plugins._utils import (
+    format_plugin_installation_message,
+    get_reader_by_name,
+    suggest_plugins_for_path,
+)
 
 
 class TestSuggestPluginsForPath:
@@ -19,20 +27,17 @@ class TestSuggestPluginsForPath:
             ('test.lif', ['bioio-lif', 'bioio-bioformats']),
             ('test.nd2', ['bioio-nd2', 'bioio-bioformats']),
             ('test.dv', ['bioio-dv', 'bioio-bioformats']),
+            ('test.OME.TIFF', ['bioio-ome-tiff']),  # compound extension
             ('test.xyz', []),  # Unsupported returns empty
         ],
     )
     def test_extension_to_plugin_mapping(self, filename, expected_plugins):
         """Test that file extensions map to correct plugin suggestions."""
-        from ndevio.bioio_plugins._utils import suggest_plugins_for_path
-
         plugins = suggest_plugins_for_path(filename)
         assert plugins == expected_plugins
 
     def test_tiff_suggests_multiple_plugins(self):
         """Test that TIFF files suggest all TIFF-compatible plugins."""
-        from ndevio.bioio_plugins._utils import suggest_plugins_for_path
-
         plugins = suggest_plugins_for_path('test.tiff')
 
         # TIFF has multiple compatible readers
@@ -41,15 +46,33 @@ class TestSuggestPluginsForPath:
         assert 'bioio-tiff-glob' in plugins
 
 
+class TestGetReaderByName:
+    """Test get_reader_by_name function."""
+
+    def test_returns_reader_class(self):
+        """Test that the plugin's Reader class is returned."""
+        assert get_reader_by_name('bioio-ome-tiff') is OmeTiffReader
+
+    def test_lookup_is_cached(self):
+        """Test that repeated lookups reuse the cached Reader class."""
+        get_reader_by_name('bioio-ome-tiff')
+        hits = get_reader_by_name.cache_info().hits
+        get_reader_by_name('bioio-ome-tiff')
+        assert get_reader_by_name.cache_info().hits == hits + 1
+
+    def test_missing_plugin_raises(self):
+        """Test that an uninstalled plugin raises ImportError uncached."""
+        with pytest.raises(ImportError):
+            get_reader_by_name('bioio-not-a-plugin')
+        with pytest.raises(ImportError):
+            get_reader_by_name('bioio-not-a-plugin')
+
+
 class TestFormatPluginInstallationMessage:
     """Test format_plugin_installation_message function."""
 
     def test_message_with_installable_plugins(self):
         """Test message includes plugin name and install command."""
-        from ndevio.bioio_plugins._utils import (
-            format_plugin_installation_message,
-        )
-
         message = format_plugin_installation_message(
             filename='test.nd2',
             suggested_plugins=['bioio-nd2'],
@@ -62,10 +85,6 @@ class TestFormatPluginInstallationMessage:
 
     def test_message_for_unsupported_extension(self):
         """Test message for extension with no known plugins."""
-        from ndevio.bioio_plugins._utils import (
-            format_plugin_installation_message,
-        )
-
         message = format_plugin_installation_message(
             filename='test.xyz',
             suggested_plugins=[],
@@ -7,6 +7,10 @@ import pytest
 
 from ndevio._napari_reader import napari_get_reader
 
+# Viewer tests contend for the QApplication/GL context; under
+# ``pytest -n auto --dist=loadgroup`` keep them together on one worker.
+pytestmark = pytest.mark.xdist_group('napari')
+
 ###############################################################################
 
 RGB_TIFF = 'RGB_bad_metadata.tiff'  # has two scenes
@@ -75,7 +79,7 @@ def test_napari_viewer_open_remote(make_napari_viewer) -> None:
     ],
 )
 def test_reader_supported_formats(
-    resources_dir: Path,
+    resource_file,
     filename: str,
     expected_shape: tuple[int, ...],
     expected_has_scale: bool,
@@ -84,8 +88,7 @@ def test_reader_supported_formats(
     """Test reader with formats that should work with core dependencies."""
 
     # Resolve filename to filepath
-    if isinstance(filename, str):
-        path = str(resources_dir / filename)
+    path = str(resource_file(filename))
 
     # Get reader
     partial_napari_reader_function = napari_get_reader(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 from unittest.mock import patch
 
@@ -21,9 +22,14 @@ ND2_FILE = 'ND2_dims_rgb.nd2'  # ND2 file requiring bioio-nd2
 ZARR = 'dimension_handling_zyx_V3.zarr'
 
 
-def test_nImage_init(resources_dir: Path):
+def _is_dask_array(obj: object) -> bool:
+    """Return True if ``obj`` is a dask array, without importing dask."""
+    return type(obj).__module__.startswith('dask.array')
+
+
+def test_nImage_init(resources_dir: Path, cells3d_img_factory):
     """Test nImage initialization with a file that should work."""
-    img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+    img = cells3d_img_factory()
     assert img.path == str(resources_dir / CELLS3D2CH_OME_TIFF)
     assert img.reader is not None
     # Shape is (T, C, Z, Y, X) = (1, 2, 60, 66, 85)
@@ -58,6 +64,16 @@ def test_nImage_zarr_trailing_slash(resources_dir: Path):
     assert img.data.shape == (1, 1, 2, 4, 4)
 
 
+def test_nImage_relative_path_is_made_absolute(
+    resources_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a relative local path is stored as an absolute path."""
+    monkeypatch.chdir(resources_dir)
+    img = nImage(ZARR)
+    assert img.path == str(resources_dir / ZARR)
+    assert not img._is_remote
+
+
 @pytest.mark.network
 def test_nImage_remote_zarr_trailing_slash():
     """Test that a remote Zarr URL with a trailing slash is read correctly.
@@ -114,7 +130,7 @@ def test_nimage_remote_v03_zarr():
     assert len(tuples) > 0
 
 
-def test_nImage_ome_reader(resources_dir: Path):
+def test_nImage_ome_reader(cells3d_img: nImage):
     """
     Test that the OME-TIFF reader is used for OME-TIFF files.
 
@@ -128,9 +144,7 @@ def test_nImage_ome_reader(resources_dir: Path):
     OME-TIFF.
     """
 
-    img_path = resources_dir / CELLS3D2CH_OME_TIFF
-
-    nimg = nImage(img_path)
+    nimg = cells3d_img
     # assert nimg.settings.ndevio_reader.preferred_reader == 'bioio-ome-tiff'  # this was the old methodology before bioio#162
     assert nimg.reader.name == 'bioio_ome_tiff'
     # the below only exists if 'bioio-ome-tiff' is used
@@ -138,7 +152,7 @@ def test_nImage_ome_reader(resources_dir: Path):
     assert nimg.channel_names == ['membrane', 'nuclei']
 
 
-def test_nImage_save_read(resources_dir: Path, tmp_path: Path):
+def test_nImage_save_read(cells3d_img: nImage, tmp_path: Path):
     """
     Test saving and reading an image with OmeTiffWriter and nImage.
 
@@ -150,12 +164,12 @@ def test_nImage_save_read(resources_dir: Path, tmp_path: Path):
     from bioio_base.types import PhysicalPixelSizes
     from bioio_ome_tiff.writers import OmeTiffWriter
 
-    img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+    img = cells3d_img
     assert img.physical_pixel_sizes.X == 1
 
-    img_data = img.get_image_data('CZYX')
+    # OmeTiffWriter computes dask input itself; no separate numpy copy needed
     OmeTiffWriter.save(
-        img_data,
+        img.get_image_dask_data('CZYX'),
         tmp_path / 'test_save_read.tiff',
         dim_order='CZYX',
         physical_pixel_sizes=PhysicalPixelSizes(1, 2, 3),  # ZYX
@@ -172,9 +186,9 @@ def test_nImage_save_read(resources_dir: Path, tmp_path: Path):
     assert new_img.channel_names == ['test1', 'test2']
 
 
-def test_get_layer_data(resources_dir: Path):
+def test_get_layer_data(cells3d_img: nImage):
     """Test loading napari layer data in memory."""
-    img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+    img = cells3d_img
     # Access layer_data property to trigger loading
     data = img.reference_xarray
     # layer_data will be squeezed
@@ -183,9 +197,9 @@ def test_get_layer_data(resources_dir: Path):
     assert data.dims == ('C', 'Z', 'Y', 'X')
 
 
-def test_get_layer_data_tuples_basic(resources_dir: Path):
+def test_get_layer_data_tuples_basic(cells3d_img: nImage):
     """Test layer data tuple generation."""
-    img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+    img = cells3d_img
     layer_tuples = img.get_layer_data_tuples()
     # With 2 channels, should get 2 tuples (one per channel)
     assert len(layer_tuples) == 2
@@ -196,7 +210,7 @@ def test_get_layer_data_tuples_basic(resources_dir: Path):
 
 
 def test_get_layer_data_tuples_ome_validation_error_logged(
-    resources_dir: Path,
+    cells3d_img_ome_error,
     caplog: pytest.LogCaptureFixture,
 ):
     """Test that OME metadata validation errors are logged but don't crash.
@@ -206,40 +220,36 @@ def test_get_layer_data_tuples_ome_validation_error_logged(
     when accessing ome_metadata. This should be logged as a warning but not
     prevent the image from loading.
     """
-    img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
-
-    # Mock ome_metadata to raise a ValidationError (which inherits from ValueError)
-    with mock.patch.object(
-        type(img),
-        'ome_metadata',
-        new_callable=mock.PropertyMock,
-        side_effect=ValueError('Invalid acquisition_mode: LatticeLightsheet'),
-    ):
-        caplog.clear()
-        layer_tuples = img.get_layer_data_tuples()
+    # ome_metadata raises a ValidationError (which inherits from ValueError)
+    img = cells3d_img_ome_error(
+        ValueError('Invalid acquisition_mode: LatticeLightsheet')
+    )
 
-        # Should still return valid layer tuples
-        assert layer_tuples is not None
-        assert len(layer_tuples) > 0
+    caplog.clear()
+    layer_tuples = img.get_layer_data_tuples()
 
-        # Check that metadata dict exists in each tuple
-        for _, meta, _ in layer_tuples:
-            assert 'name' in meta
-            assert 'metadata' in meta
-            # ome_metadata should NOT be in the nested metadata dict
-            assert 'ome_metadata' not in meta['metadata']
-            # raw_image_metadata should still be available
-            assert 'raw_image_metadata' in meta['metadata']
+    # Should still return valid layer tuples
+    assert layer_tuples is not None
+    assert len(layer_tuples) > 0
 
-        # Warning should be logged
-        assert len(caplog.records) == 1
-        assert caplog.records[0].levelname == 'WARNING'
-        assert 'Could not parse OME metadata' in caplog.records[0].message
-        assert 'LatticeLightsheet' in caplog.records[0].message
+    # Check that metadata dict exists in each tuple
+    for _, meta, _ in layer_tuples:
+        assert 'name' in meta
+        assert 'metadata' in meta
+        # ome_metadata should NOT be in the nested metadata dict
+        assert 'ome_metadata' not in meta['metadata']
+        # raw_image_metadata should still be available
+        assert 'raw_image_metadata' in meta['metadata']
+
+    # Warning should be logged
+    assert len(caplog.records) == 1
+    assert caplog.records[0].levelname == 'WARNING'
+    assert 'Could not parse OME metadata' in caplog.records[0].message
+    assert 'LatticeLightsheet' in caplog.records[0].message
 
 
 def test_get_layer_data_tuples_ome_not_implemented_silent(
-    resources_dir: Path,
+    cells3d_img_ome_error,
     caplog: pytest.LogCaptureFixture,
 ):
     """Test that NotImplementedError for ome_metadata is silently ignored.
@@ -247,29 +257,22 @@ def test_get_layer_data_tuples_ome_not_implemented_silent(
     Some readers don't support OME metadata at all. This should be silently
     ignored without logging.
     """
-    img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
-
-    # Mock ome_metadata to raise NotImplementedError
-    with mock.patch.object(
-        type(img),
-        'ome_metadata',
-        new_callable=mock.PropertyMock,
-        side_effect=NotImplementedError(
-            'Reader does not support OME metadata'
-        ),
-    ):
-        caplog.clear()
-        layer_tuples = img.get_layer_data_tuples()
+    img = cells3d_img_ome_error(
+        NotImplementedError('Reader does not support OME metadata')
+    )
 
-        # Should still return valid layer tuples
-        assert layer_tuples is not None
-        assert len(layer_tuples) > 0
+    caplog.clear()
+    layer_tuples = img.get_layer_data_tuples()
 
-        for _, meta, _ in layer_tuples:
-            assert 'ome_metadata' not in meta['metadata']
+    # Should still return valid layer tuples
+    assert layer_tuples is not None
+    assert len(layer_tuples) > 0
 
-        # No warning should be logged for NotImplementedError
-        assert len(caplog.records) == 0
+    for _, meta, _ in layer_tuples:
+        assert 'ome_metadata' not in meta['metadata']
+
+    # No warning should be logged for NotImplementedError
+    assert len(caplog.records) == 0
 
 
 @pytest.mark.parametrize(
@@ -281,9 +284,10 @@ def test_get_layer_data_tuples_ome_not_implemented_silent(
         (ND2_FILE, False, ['bioio-nd2', 'pip install']),
         (RGB_TIFF, True, None),
     ],
+    ids=['png', 'ome-tiff', 'czi', 'nd2-missing-plugin', 'rgb-tiff'],
 )
 def test_nimage_init_with_various_formats(
-    resources_dir: Path,
+    resource_file,
     filename: str,
     should_work: bool | str,
     expected_error_contains: list[str] | None,
@@ -292,15 +296,16 @@ def test_nimage_init_with_various_formats(
 
     This tests the complete workflow: file → get_reader_priority → nImage init
     """
+    path = resource_file(filename)
     if should_work is True:
         # Must successfully initialize
-        img = nImage(resources_dir / filename)
+        img = nImage(path)
         assert img.data is not None
-        assert img.path == str(resources_dir / filename)
+        assert img.path == str(path)
     elif should_work is False:
         # Must fail with helpful error
         with pytest.raises(UnsupportedFileFormatError) as exc_info:
-            nImage(resources_dir / filename)
+            nImage(path)
 
         error_msg = str(exc_info.value)
         if expected_error_contains:
@@ -309,7 +314,7 @@ def test_nimage_init_with_various_formats(
     else:  # "maybe"
         # Can succeed or fail
         try:
-            img = nImage(resources_dir / filename)
+            img = nImage(path)
             assert img.data is not None
         except UnsupportedFileFormatError as e:
             error_msg = str(e)
@@ -328,12 +333,12 @@ def test_nimage_init_with_various_formats(
 class TestGetLayerDataTuples:
     """Tests for nImage.get_layer_data_tuples method."""
 
-    def test_multichannel_returns_tuple_per_channel(self, resources_dir: Path):
+    def test_multichannel_returns_tuple_per_channel(self, cells3d_img: nImage):
         """Test that multichannel images return one tuple per channel.
 
         The new API always splits channels, returning separate tuples for each.
         """
-        img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+        img = cells3d_img
         layer_tuples = img.get_layer_data_tuples()
 
         # Should return one tuple per channel (2 channels)
@@ -355,9 +360,9 @@ class TestGetLayerDataTuples:
             # Default layer type is "image" (channel names don't match label keywords)
             assert layer_type == 'image'
 
-    def test_layer_names_include_channel_names(self, resources_dir: Path):
+    def test_layer_names_include_channel_names(self, cells3d_img: nImage):
         """Test that layer names include channel names from the file."""
-        img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+        img = cells3d_img
         layer_tuples = img.get_layer_data_tuples()
 
         # Extract names from the tuples
@@ -367,9 +372,9 @@ class TestGetLayerDataTuples:
         assert 'membrane' in names[0]
         assert 'nuclei' in names[1]
 
-    def test_layer_names_matches_tuple_names(self, resources_dir: Path):
+    def test_layer_names_matches_tuple_names(self, cells3d_img: nImage):
         """Test that layer_names property matches names in get_layer_data_tuples."""
-        img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+        img = cells3d_img
         layer_tuples = img.get_layer_data_tuples()
 
         # layer_names should match names baked into the tuples
@@ -399,9 +404,9 @@ class TestGetLayerDataTuples:
         assert 'channel_axis' not in meta
         assert layer_type == 'image'
 
-    def test_scale_preserved_in_tuples(self, resources_dir: Path):
+    def test_scale_preserved_in_tuples(self, cells3d_img: nImage):
         """Test that scale metadata is preserved in each tuple."""
-        img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+        img = cells3d_img
         layer_tuples = img.get_layer_data_tuples()
 
         for _, meta, _ in layer_tuples:
@@ -410,14 +415,14 @@ class TestGetLayerDataTuples:
             # Original has physical pixel sizes, so scale should have values
             assert len(meta['scale']) > 0
 
-    def test_colormap_cycling_for_images(self, resources_dir: Path):
+    def test_colormap_cycling_for_images(self, cells3d_img: nImage):
         """Test that image layers get colormaps based on napari's defaults.
 
         - 1 channel → gray
         - 2 channels → magenta, green (MAGENTA_GREEN)
         - 3+ channels → cycles through CYMRGB
         """
-        img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+        img = cells3d_img
         layer_tuples = img.get_layer_data_tuples()
 
         # Extract colormaps from the tuples
@@ -535,9 +540,9 @@ class TestGetLayerDataTuples:
         # Labels should not have colormap
         assert 'colormap' not in layer_tuples[0][1]
 
-    def test_layer_type_override_all_channels(self, resources_dir: Path):
+    def test_layer_type_override_all_channels(self, cells3d_img: nImage):
         """Test that layer_type parameter overrides all channels."""
-        img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+        img = cells3d_img
         layer_tuples = img.get_layer_data_tuples(layer_type='labels')
 
         # All channels should be labels due to override
@@ -571,9 +576,9 @@ class TestGetLayerDataTuples:
         # Both should be labels due to layer_type override
         assert layer_tuples[0][2] == 'labels'
 
-    def test_channel_kwargs_override_metadata(self, resources_dir: Path):
+    def test_channel_kwargs_override_metadata(self, cells3d_img: nImage):
         """Test that channel_kwargs overrides default metadata."""
-        img = nImage(resources_dir / CELLS3D2CH_OME_TIFF)
+        img = cells3d_img
         layer_tuples = img.get_layer_data_tuples(
             channel_kwargs={
                 img.channel_names[0]: {
@@ -597,76 +602,91 @@ class TestGetLayerDataTuples:
         )  # default for 2-channel
 
 
+@pytest.fixture
+def mock_resolve_reader(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+    """Replace ``ndevio.nimage._resolve_reader`` with a plain ``Mock``.
+
+    Returns ``None`` (let bioio choose) unless a test sets ``return_value``.
+    """
+    resolve = mock.Mock(return_value=None)
+    monkeypatch.setattr('ndevio.nimage._resolve_reader', resolve)
+    return resolve
+
+
 class TestPreferredReaderFallback:
     """Tests for preferred reader fallback logic in nImage.__init__."""
 
-    def test_preferred_reader_success(self, resources_dir: Path):
+    def test_preferred_reader_success(
+        self, resources_dir: Path, mock_resolve_reader: mock.Mock
+    ):
         """Test that preferred reader is used when it works."""
-        with patch('ndevio.nimage._resolve_reader') as mock_resolve:
-            # Mock returning a valid reader
-            from bioio_tifffile import Reader
+        # Mock returning a valid reader
+        from bioio_tifffile import Reader
 
-            mock_resolve.return_value = Reader
+        mock_resolve_reader.return_value = Reader
 
-            img = nImage(str(resources_dir / 'cells3d2ch_legacy.tiff'))
+        img = nImage(str(resources_dir / 'cells3d2ch_legacy.tiff'))
 
-            # Verify _resolve_reader was called
-            mock_resolve.assert_called_once()
-            assert img is not None
-            assert img.reader.name == 'bioio_tifffile'
+        # Verify _resolve_reader was called
+        mock_resolve_reader.assert_called_once()
+        assert img is not None
+        assert img.reader.name == 'bioio_tifffile'
 
-    def test_preferred_reader_fallback(self, resources_dir: Path):
+    def test_preferred_reader_fallback(
+        self, resources_dir: Path, mock_resolve_reader: mock.Mock
+    ):
         """Test that failed preferred reader will fallback"""
-        with patch('ndevio.nimage._resolve_reader') as mock_resolve:
-            # Mock returning a reader that won't work for this file
-            from bioio_czi import Reader
+        # Mock returning a reader that won't work for this file
+        Reader = pytest.importorskip('bioio_czi').Reader
 
-            mock_resolve.return_value = Reader
+        mock_resolve_reader.return_value = Reader
 
-            img = nImage(str(resources_dir / 'cells3d2ch_legacy.tiff'))
+        img = nImage(str(resources_dir / 'cells3d2ch_legacy.tiff'))
 
-            # Verify _resolve_reader was called
-            mock_resolve.assert_called_once()
-            assert img is not None
-            # Should have fallen back to bioio's default (ome-tiff)
-            assert img.reader.name == 'bioio_ome_tiff'
+        # Verify _resolve_reader was called
+        mock_resolve_reader.assert_called_once()
+        assert img is not None
+        # Should have fallen back to bioio's default (ome-tiff)
+        assert img.reader.name == 'bioio_ome_tiff'
 
-    def test_no_preferred_reader_uses_default(self, resources_dir: Path):
+    def test_no_preferred_reader_uses_default(
+        self, resources_dir: Path, mock_resolve_reader: mock.Mock
+    ):
         """Test that no preferred reader uses bioio's default priority."""
-        with patch('ndevio.nimage._resolve_reader') as mock_resolve:
-            mock_resolve.return_value = None  # No preferred reader
-
-            img = nImage(str(resources_dir / 'cells3d2ch_legacy.tiff'))
-            assert img is not None
-            mock_resolve.assert_called_once()
-            assert img.reader.name == 'bioio_ome_tiff'
+        img = nImage(str(resources_dir / 'cells3d2ch_legacy.tiff'))
+        assert img is not None
+        mock_resolve_reader.assert_called_once()
+        assert img.reader.name == 'bioio_ome_tiff'
 
 
 class TestResolveReaderFunction:
     """Tests for _resolve_reader function."""
 
-    def test_returns_none_when_no_preferred_reader(self):
+    @pytest.fixture
+    def mock_get_settings(self, monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+        """Replace ``ndev_settings.get_settings`` with a fresh ``Mock``."""
+        get_settings = mock.Mock()
+        monkeypatch.setattr('ndev_settings.get_settings', get_settings)
+        return get_settings
+
+    def test_returns_none_when_no_preferred_reader(self, mock_get_settings):
         """Test returns None when preferred_reader is not set."""
         from ndevio.nimage import _resolve_reader
 
-        with patch('ndev_settings.get_settings') as mock_get_settings:
-            mock_get_settings.return_value.ndevio_reader.preferred_reader = (
-                None
-            )
+        mock_get_settings.return_value.ndevio_reader.preferred_reader = None
 
-            result = _resolve_reader('test.tiff', None)
-            assert result is None
+        result = _resolve_reader('test.tiff', None)
+        assert result is None
 
-    def test_returns_none_when_preferred_not_installed(self):
+    def test_returns_none_when_preferred_not_installed(
+        self, mock_get_settings
+    ):
         """Test returns None when preferred reader is not installed."""
         from ndevio.nimage import _resolve_reader
 
-        with (
-            patch('ndev_settings.get_settings') as mock_get_settings,
-            patch(
-                'ndevio.bioio_plugins._utils.get_installed_plugins',
-                return_value={'bioio-ome-tiff', 'bioio-tifffile'},
-            ),
+        with patch(
+            'ndevio.bioio_plugins._utils.get_installed_plugins',
+            return_value=frozenset({'bioio-ome-tiff', 'bioio-tifffile'}),
         ):
             mock_get_settings.return_value.ndevio_reader.preferred_reader = (
                 'bioio-czi'
@@ -675,15 +695,14 @@ class TestResolveReaderFunction:
             result = _resolve_reader('test.tiff', None)
             assert result is None
 
-    def test_returns_reader_when_preferred_installed(self):
+    def test_returns_reader_when_preferred_installed(self, mock_get_settings):
         """Test returns reader class when preferred reader is installed."""
         from ndevio.nimage import _resolve_reader
 
         with (
-            patch('ndev_settings.get_settings') as mock_get_settings,
             patch(
                 'ndevio.bioio_plugins._utils.get_installed_plugins',
-                return_value={'bioio-ome-tiff'},
+                return_value=frozenset({'bioio-ome-tiff'}),
             ),
             patch(
                 'ndevio.bioio_plugins._utils.get_reader_by_name'
@@ -700,54 +719,53 @@ class TestResolveReaderFunction:
             assert result == OmeTiffReader
             mock_get_reader.assert_called_once_with('bioio-ome-tiff')
 
-    def test_explicit_reader_bypasses_settings(self):
+    def test_explicit_reader_bypasses_settings(self, mock_get_settings):
         """Test that explicit reader bypasses settings lookup."""
         from bioio_tifffile import Reader as TifffileReader
 
         from ndevio.nimage import _resolve_reader
 
-        with patch('ndev_settings.get_settings') as mock_get_settings:
-            result = _resolve_reader('test.tiff', TifffileReader)
+        result = _resolve_reader('test.tiff', TifffileReader)
 
-            # Should return explicit reader without checking settings
-            assert result == TifffileReader
-            mock_get_settings.assert_not_called()
+        # Should return explicit reader without checking settings
+        assert result == TifffileReader
+        mock_get_settings.assert_not_called()
 
-    def test_array_input_returns_none(self):
+    def test_array_input_returns_none(self, mock_get_settings):
         """Test that array inputs don't trigger preferred reader lookup."""
         import numpy as np
 
         from ndevio.nimage import _resolve_reader
 
-        with patch('ndev_settings.get_settings') as mock_get_settings:
-            arr = np.zeros((10, 10), dtype=np.uint8)
-            result = _resolve_reader(arr, None)
+        arr = np.zeros((10, 10), dtype=np.uint8)
+        result = _resolve_reader(arr, None)
 
-            # Should return None without checking settings for arrays
-            assert result is None
-            mock_get_settings.assert_not_called()
+        # Should return None without checking settings for arrays
+        assert result is None
+        mock_get_settings.assert_not_called()
 
 
 class TestNonPathImageHandling:
     """Tests for handling non-path inputs (arrays)."""
 
-    def test_array_input_no_preferred_reader_check(self):
+    def test_array_input_no_preferred_reader_check(
+        self, mock_resolve_reader: mock.Mock
+    ):
         """Test that arrays don't trigger preferred reader logic."""
         import numpy as np
 
-        with patch('ndevio.nimage._resolve_reader') as mock_resolve:
-            # Create a simple array
-            arr = np.zeros((10, 10), dtype=np.uint8)
+        # Create a simple array
+        arr = np.zeros((10, 10), dtype=np.uint8)
 
-            # This should work
-            img = nImage(arr)
-            assert img is not None
+        # This should work
+        img = nImage(arr)
+        assert img is not None
 
-            # _resolve_reader should have been called but returned None
-            mock_resolve.assert_called_once()
-            # First arg is the image, second is explicit_reader (None)
-            call_args = mock_resolve.call_args
-            assert call_args[0][1] is None  # explicit_reader is None
+        # _resolve_reader should have been called but returned None
+        mock_resolve_reader.assert_called_once()
+        # First arg is the image, second is explicit_reader (None)
+        call_args = mock_resolve_reader.call_args
+        assert call_args[0][1] is None  # explicit_reader is None
 
     def test_unsupported_array_raises_without_suggestions(self):
         """Test that unsupported arrays raise error without plugin suggestions."""
@@ -766,28 +784,29 @@ class TestNonPathImageHandling:
 class TestExplicitReaderParameter:
     """Tests for when reader is explicitly provided."""
 
-    def test_explicit_reader_bypasses_preferred(self, resources_dir: Path):
+    def test_explicit_reader_bypasses_preferred(
+        self, resources_dir: Path, mock_resolve_reader: mock.Mock
+    ):
         """Test that explicit reader parameter bypasses preferred reader."""
         from bioio_tifffile import Reader as TifffileReader
 
-        with patch('ndevio.nimage._resolve_reader') as mock_resolve:
-            mock_resolve.return_value = TifffileReader
+        mock_resolve_reader.return_value = TifffileReader
 
-            # Explicit reader should be used directly
-            img = nImage(
-                str(resources_dir / 'cells3d2ch_legacy.tiff'),
-                reader=TifffileReader,
-            )
+        # Explicit reader should be used directly
+        img = nImage(
+            str(resources_dir / 'cells3d2ch_legacy.tiff'),
+            reader=TifffileReader,
+        )
 
-            assert img is not None
-            # _resolve_reader should return the explicit reader
-            mock_resolve.assert_called_once()
-            call_args = mock_resolve.call_args
-            assert call_args[0][1] == TifffileReader  # explicit_reader
+        assert img is not None
+        # _resolve_reader should return the explicit reader
+        mock_resolve_reader.assert_called_once()
+        call_args = mock_resolve_reader.call_args
+        assert call_args[0][1] == TifffileReader  # explicit_reader
 
     def test_explicit_reader_fails_falls_back(self, resources_dir: Path):
         """Test explicit reader that fails falls back to default."""
-        from bioio_czi import Reader as CziReader
+        CziReader = pytest.importorskip('bioio_czi').Reader
 
         # Use CZI reader on a TIFF file - it should fail and fall back
         img = nImage(
@@ -820,31 +839,44 @@ class TestFitsInMemory:
 
         with mock.patch(
             'psutil.virtual_memory',
-            return_value=mock.Mock(available=int(1e10)),
+            return_value=SimpleNamespace(available=int(1e10)),
         ):
             img = nImage(path)
             assert img._fits_in_memory() is True
 
-    def test_exceeds_memory_percentage_returns_false(self, tmp_path):
+    def test_exceeds_memory_percentage_returns_false(self):
         """Image whose uncompressed size exceeds 30% of available RAM → dask."""
-        import numpy as np
-        import tifffile
+        from ndevio.nimage import _nbytes_fit_in_memory
 
         # 50×50×50×uint32 = 500 KB uncompressed
-        path = tmp_path / 'medium.tif'
-        tifffile.imwrite(str(path), np.zeros((50, 50, 50), dtype=np.uint32))
-
         # 30% of 1 MB = 300 KB < 500 KB → should not fit
         with mock.patch(
-            'psutil.virtual_memory', return_value=mock.Mock(available=int(1e6))
+            'psutil.virtual_memory',
+            return_value=SimpleNamespace(available=int(1e6)),
         ):
-            img = nImage(path)
-            assert img._fits_in_memory() is False
+            assert _nbytes_fit_in_memory(50 * 50 * 50 * 4) is False
+
+    def test_exceeds_max_in_mem_setting_returns_false(self):
+        """Image larger than max_in_mem_gb → dask, even with RAM to spare."""
+        from ndevio.nimage import _nbytes_fit_in_memory
+
+        with (
+            mock.patch(
+                'ndev_settings.get_settings',
+                return_value=SimpleNamespace(
+                    ndevio_reader=SimpleNamespace(max_in_mem_gb=1.0),
+                ),
+            ),
+            mock.patch(
+                'psutil.virtual_memory',
+                return_value=SimpleNamespace(available=int(1e12)),
+            ),
+        ):
+            assert _nbytes_fit_in_memory(int(1e9)) is True
+            assert _nbytes_fit_in_memory(int(1e9) + 1) is False
 
     def test_missing_max_in_mem_setting_falls_back_to_default(self, tmp_path):
         """Older persisted settings missing max_in_mem_gb should use 8 GB."""
-        from types import SimpleNamespace
-
         import numpy as np
         import tifffile
 
@@ -860,7 +892,7 @@ class TestFitsInMemory:
             ),
             mock.patch(
                 'psutil.virtual_memory',
-                return_value=mock.Mock(available=int(1e10)),
+                return_value=SimpleNamespace(available=int(1e10)),
             ),
         ):
             img = nImage(path)
@@ -905,16 +937,15 @@ def test_compressed_int32_tiff_uses_dask(tmp_path: Path):
         'test precondition: compressed file must be tiny vs uncompressed'
     )
 
-    import dask.array as da
-
     # Mock RAM so the memory-fraction check forces dask (288 MB > 30% of 500 MB).
     # This isolates the test from machine memory and makes it deterministic.
     with mock.patch(
-        'psutil.virtual_memory', return_value=mock.Mock(available=int(500e6))
+        'psutil.virtual_memory',
+        return_value=SimpleNamespace(available=int(500e6)),
     ):
         img = nImage(path)
 
-        assert isinstance(img.reference_xarray.data, da.Array), (
+        assert _is_dask_array(img.reference_xarray.data), (
             f'Expected dask array, got {type(img.reference_xarray.data)}'
         )
 
@@ -922,7 +953,7 @@ def test_compressed_int32_tiff_uses_dask(tmp_path: Path):
         assert len(tuples) == 1
         data_out, _, _ = tuples[0]
         assert isinstance(data_out, list)
-        assert isinstance(data_out[0], da.Array), (
+        assert _is_dask_array(data_out[0]), (
             f'Expected dask array in layer tuple, got {type(data_out[0])}'
         )
 
@@ -988,7 +1019,6 @@ def test_dask_chunks_are_per_plane(tmp_path: Path):
     For a (Z=8, Y=64, X=64) file the resulting dask array should have chunks
     (1, 64, 64), not (8, 64, 64).
     """
-    import dask.array as da
     import numpy as np
     import tifffile
 
@@ -1000,7 +1030,8 @@ def test_dask_chunks_are_per_plane(tmp_path: Path):
 
     # Force dask: mock available RAM so the memory-fraction check triggers.
     with mock.patch(
-        'psutil.virtual_memory', return_value=mock.Mock(available=int(1e6))
+        'psutil.virtual_memory',
+        return_value=SimpleNamespace(available=int(1e6)),
     ):
         img = nImage(path)
         tuples = img.get_layer_data_tuples()
@@ -1008,7 +1039,7 @@ def test_dask_chunks_are_per_plane(tmp_path: Path):
     data_out, _, _ = tuples[0]
     # layer_data is always a list (multiscale-compatible); [0] is level 0.
     arr = data_out[0]
-    assert isinstance(arr, da.Array), f'Expected dask array, got {type(arr)}'
+    assert _is_dask_array(arr), f'Expected dask array, got {type(arr)}'
 
     z_chunk, y_chunk, x_chunk = arr.chunksize
     assert z_chunk == 1, (
@@ -2,7 +2,6 @@
 
 import numpy as np
 import pytest
-from bioio.writers import OmeTiffWriter
 
 from ndevio import nImage
 from ndevio.utils.helpers import (
@@ -71,6 +70,8 @@ class TestCreateIdString:
 
     def test_with_ome_metadata_name(self, tmp_path):
         """Test that OmeTiffWriter image_name is used in ID string."""
+        from bioio.writers import OmeTiffWriter
+
         OmeTiffWriter.save(
             data=np.random.random((2, 2)),
             uri=tmp_path / 'test.tiff',
@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+import pytest
+
+from ndevio.utils._layer_utils import (
+    CHANNEL_LABEL_KEYWORDS,
+    FILE_LABEL_KEYWORDS,
+)
+
 
 class TestResolveLayerType:
     """Tests for resolve_layer_type function."""
@@ -97,6 +104,55 @@ class TestResolveLayerType:
             resolve_layer_type(channel_name='DAPI', path_stem=None) == 'image'
         )
 
+    @pytest.mark.parametrize('keyword', sorted(CHANNEL_LABEL_KEYWORDS))
+    def test_every_channel_keyword_detected(self, keyword):
+        """Test each channel keyword is matched as a mixed-case substring."""
+        from ndevio.utils._layer_utils import resolve_layer_type
+
+        channel_name = f'Nuclei_{keyword.upper()}_01'
+        assert resolve_layer_type(channel_name=channel_name) == 'labels'
+
+    @pytest.mark.parametrize('keyword', sorted(FILE_LABEL_KEYWORDS))
+    def test_every_file_keyword_detected(self, keyword):
+        """Test each file keyword in the path stem marks labels."""
+        from ndevio.utils._layer_utils import resolve_layer_type
+
+        assert (
+            resolve_layer_type(channel_name='0', path_stem=f'cells_{keyword}')
+            == 'labels'
+        )
+
+    def test_channel_only_keyword_ignored_in_path_stem(self):
+        """Test channel-only keywords (e.g. 'seg') don't match path stems."""
+        from ndevio.utils._layer_utils import resolve_layer_type
+
+        assert 'seg' not in FILE_LABEL_KEYWORDS
+        assert (
+            resolve_layer_type(channel_name='0', path_stem='cells_seg')
+            == 'image'
+        )
+
+    def test_channel_types_miss_falls_back_to_detection(self):
+        """Test a name missing from channel_types is auto-detected."""
+        from ndevio.utils._layer_utils import resolve_layer_type
+
+        channel_types = {'DAPI': 'image'}
+        assert (
+            resolve_layer_type(
+                channel_types=channel_types, channel_name='nuclei_mask'
+            )
+            == 'labels'
+        )
+
+    def test_empty_global_override_is_honored(self):
+        """Test an empty-string override is used, not treated as unset."""
+        from ndevio.utils._layer_utils import resolve_layer_type
+
+        assert (
+            resolve_layer_type(global_override='', channel_name='nuclei_mask')
+            == ''
+        )
+
 
 class TestBuildLayerTuple:
     """Tests for build_layer_tuple function."""
@@ -168,6 +224,52 @@ class TestBuildLayerTuple:
             'colormap' not in result[1]
         )  # RGB images shouldn't have colormap
 
+    def test_rgb_kwargs_not_shared_between_calls(self):
+        """Test mutating one RGB layer's kwargs does not leak into the next."""
+        import numpy as np
+
+        from ndevio.utils._layer_utils import build_layer_tuple
+
+        def build():
+            return build_layer_tuple(
+                np.zeros((10, 10, 3)),
+                layer_type='image',
+                name='rgb_image',
+                metadata={},
+                scale=(1.0, 1.0),
+                axis_labels=('Y', 'X'),
+                units=(None, None),
+                rgb=True,
+            )
+
+        first = build()
+        first[1]['rgb'] = False
+        first[1]['opacity'] = 0.5
+
+        second = build()
+        assert second[1]['rgb'] is True
+        assert 'opacity' not in second[1]
+
+    def test_rgb_extra_kwargs_override(self):
+        """Test extra_kwargs are applied after the RGB defaults."""
+        import numpy as np
+
+        from ndevio.utils._layer_utils import build_layer_tuple
+
+        result = build_layer_tuple(
+            np.zeros((10, 10, 3)),
+            layer_type='image',
+            name='rgb_image',
+            metadata={},
+            scale=(1.0, 1.0),
+            axis_labels=('Y', 'X'),
+            units=(None, None),
+            rgb=True,
+            extra_kwargs={'rgb': False},
+        )
+
+        assert result[1]['rgb'] is False
+
     def test_image_gets_colormap(self):
         """Test that non-RGB images get colormap."""
         import numpy as np
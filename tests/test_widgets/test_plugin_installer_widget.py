@@ -6,66 +6,108 @@ This module tests:
 """
 
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
 
 import pytest
 
+from ndevio._napari_reader import _open_plugin_installer
+from ndevio.bioio_plugins._manager import ReaderPluginManager
+from ndevio.bioio_plugins._utils import BIOIO_PLUGINS, get_installed_plugins
+from ndevio.widgets._plugin_install_widget import PluginInstallerWidget
 
+EXPECTED_PLUGIN_NAMES = frozenset(BIOIO_PLUGINS)
+
+
+@pytest.fixture(scope='class')
+def default_widget(qapp):
+    """Standalone widget shared by tests that do not mutate it."""
+    return PluginInstallerWidget()
+
+
+@pytest.mark.usefixtures('qapp')
 class TestPluginInstallerWidget:
-    """Tests for PluginInstallerWidget behavior."""
+    """Tests for PluginInstallerWidget behavior (QApplication, no viewer)."""
 
-    def test_standalone_mode(self):
+    def test_standalone_mode(self, default_widget):
         """Test widget in standalone mode - no path, shows generic title."""
-        from ndevio.widgets._plugin_install_widget import PluginInstallerWidget
-
-        widget = PluginInstallerWidget()
+        widget = default_widget
 
         # Standalone mode: no path, generic title
         assert widget.manager.path is None
         assert 'Install BioIO Reader Plugin' in widget._title_label.value
 
-    def test_error_mode_with_path(self):
-        """Test widget in error mode - has path, preselects suggested plugin."""
-        from ndevio.bioio_plugins._manager import ReaderPluginManager
-        from ndevio.widgets._plugin_install_widget import PluginInstallerWidget
+    def test_lists_all_known_plugins(self, default_widget):
+        """Test the plugin dropdown offers every plugin in the registry."""
+        choices = default_widget._plugin_select.choices
+        assert frozenset(choices) - {None} == EXPECTED_PLUGIN_NAMES
 
+    def test_error_mode_with_path(self, monkeypatch):
+        """Test widget in error mode - has path, preselects suggested plugin."""
         # Mock installed plugins to NOT include bioio-czi
         # This simulates the error case where file can't be read
-        with patch(
+        monkeypatch.setattr(
             'ndevio.bioio_plugins._manager.get_installed_plugins',
-            return_value={'bioio-ome-tiff'},
-        ):
-            manager = ReaderPluginManager('test.czi')
-            widget = PluginInstallerWidget(plugin_manager=manager)
-
-            # Error mode: has path, shows filename, preselects installable plugin
-            assert 'test.czi' in widget._title_label.value
-            assert 'bioio-czi' in manager.suggested_plugins
-            # bioio-czi should be in installable since it's not installed
-            assert 'bioio-czi' in manager.installable_plugins
-            # Value should be set to first installable plugin
-            assert widget._plugin_select.value is not None
-
-    def test_install_button_behavior(self):
+            lambda: frozenset({'bioio-ome-tiff'}),
+        )
+        manager = ReaderPluginManager('test.czi')
+        widget = PluginInstallerWidget(plugin_manager=manager)
+
+        # Error mode: has path, shows filename, preselects installable plugin
+        assert 'test.czi' in widget._title_label.value
+        assert 'bioio-czi' in manager.suggested_plugins
+        # bioio-czi should be in installable since it's not installed
+        assert 'bioio-czi' in manager.installable_plugins
+        # Value should be set to first installable plugin
+        assert widget._plugin_select.value is not None
+
+    def test_install_button_behavior(self, monkeypatch):
         """Test install button: queues installation and updates status."""
-        from ndevio.widgets._plugin_install_widget import PluginInstallerWidget
-
         widget = PluginInstallerWidget()
         widget._plugin_select.value = 'bioio-imageio'
 
-        with patch(
-            'ndevio.bioio_plugins._installer.install_plugin'
-        ) as mock_install:
-            mock_install.return_value = 123
-            widget._on_install_clicked()
+        calls = []
+        monkeypatch.setattr(
+            'ndevio.bioio_plugins._installer.install_plugin',
+            lambda name: calls.append(name) or 123,
+        )
+        widget._on_install_clicked()
 
-            mock_install.assert_called_once_with('bioio-imageio')
-            assert 'Installing' in widget._status_label.value
+        assert calls == ['bioio-imageio']
+        assert 'Installing' in widget._status_label.value
+
+    def test_successful_install_clears_installed_plugins_cache(
+        self, monkeypatch
+    ):
+        """Test a finished install drops the cached installed plugins."""
+        callbacks = []
+        queue = SimpleNamespace(
+            processFinished=SimpleNamespace(
+                connect=callbacks.append,
+                disconnect=callbacks.remove,
+            )
+        )
+        monkeypatch.setattr(
+            'ndevio.bioio_plugins._installer.get_installer_queue',
+            lambda: queue,
+        )
+        monkeypatch.setattr(
+            'ndevio.bioio_plugins._installer.install_plugin',
+            lambda name: 123,
+        )
+        widget = PluginInstallerWidget()
+        widget._plugin_select.value = 'bioio-lif'
+        widget._on_install_clicked()
+
+        get_installed_plugins()
+        assert get_installed_plugins.cache_info().currsize == 1
+
+        callbacks[0]({'exit_code': 0, 'pkgs': ['bioio-lif']})
+
+        assert get_installed_plugins.cache_info().currsize == 0
+        assert 'Successfully installed' in widget._status_label.value
 
     def test_install_without_selection_shows_error(self):
         """Test that clicking install with no selection shows error."""
-        from ndevio.widgets._plugin_install_widget import PluginInstallerWidget
-
         widget = PluginInstallerWidget()
         widget._plugin_select.value = None
 
@@ -74,18 +116,24 @@ class TestPluginInstallerWidget:
         assert 'No plugin selected' in widget._status_label.value
 
 
+@pytest.mark.xdist_group('napari')
 class TestOpenPluginInstallerIntegration:
     """Integration tests for _open_plugin_installer with napari viewer."""
 
-    @pytest.fixture
-    def viewer_with_plugin_installer(self, make_napari_viewer):
-        """Fixture that creates viewer and opens plugin installer for .czi."""
-        import ndevio._napari_reader as reader_module
-
+    @pytest.fixture(
+        params=[
+            ('path/to/test.czi', 'bioio-czi'),
+            ('path/to/test.lif', 'bioio-lif'),
+        ],
+        ids=['czi', 'lif'],
+    )
+    def viewer_with_plugin_installer(self, request, make_napari_viewer):
+        """Create a viewer and open the plugin installer for each path."""
         viewer = make_napari_viewer()
-        test_path = Path('path/to/test.czi')
+        path, expected_plugin = request.param
+        test_path = Path(path)
 
-        reader_module._open_plugin_installer(test_path)
+        _open_plugin_installer(test_path)
 
         # Find the widget
         widget = None
@@ -94,13 +142,15 @@ class TestOpenPluginInstallerIntegration:
                 widget = w
                 break
 
-        return viewer, widget, test_path
+        return viewer, widget, test_path, expected_plugin
 
     def test_docks_widget_with_correct_state(
         self, viewer_with_plugin_installer
     ):
         """Test that _open_plugin_installer docks widget with correct state."""
-        viewer, widget, test_path = viewer_with_plugin_installer
+        viewer, widget, test_path, expected_plugin = (
+            viewer_with_plugin_installer
+        )
 
         # Widget is docked
         assert len(viewer.window.dock_widgets) > 0
@@ -109,4 +159,4 @@ class TestOpenPluginInstallerIntegration:
         # Widget has correct path and suggestions
         assert widget.manager.path == test_path
         assert test_path.name in widget._title_label.value
-        assert 'bioio-czi' in widget.manager.suggested_plugins
+        assert expected_plugin in widget.manager.suggested_plugins